@@ -978,6 +978,15 @@ def mock_close(*args, **kwargs):
         rh.close()
         assert called
 
+    def test_http_adapter_shared_between_cookiejars(self, handler):
+        with handler() as rh:
+            session = rh._get_instance(cookiejar=rh.cookiejar)
+            other_session = rh._get_instance(cookiejar=YoutubeDLCookieJar())
+            assert session is not other_session
+            assert session.get_adapter('https://') is other_session.get_adapter('https://')
+            legacy_session = rh._get_instance(cookiejar=rh.cookiejar, legacy_ssl_support=True)
+            assert legacy_session.get_adapter('https://') is not session.get_adapter('https://')
+
 
 @pytest.mark.parametrize('handler', ['CurlCFFI'], indirect=True)
 class TestCurlCFFIRequestHandler(TestRequestHandlerBase):
@@ -1700,6 +1709,24 @@ def _send(self, request: Request):
             assert ydl._impersonate_target_available(ImpersonateTarget())
             assert not ydl._impersonate_target_available(ImpersonateTarget('zxy'))
 
+    def test_resolve_impersonate_target(self):
+        class IRH(ImpersonateRequestHandler):
+            def _send(self, request: Request):
+                pass
+
+            _SUPPORTED_URL_SCHEMES = ('http',)
+            _SUPPORTED_IMPERSONATE_TARGET_MAP = {
+                ImpersonateTarget('abc', '1'): 'test1',
+                ImpersonateTarget('abc'): 'test',
+            }
+
+        rh = IRH(logger=FakeLogger())
+        assert rh._resolve_target(None) is None
+        for _ in range(2):
+            assert rh._resolve_target(ImpersonateTarget('abc')) == ImpersonateTarget('abc', '1')
+            assert rh._resolve_target(ImpersonateTarget('abc', '2')) == ImpersonateTarget('abc')
+            assert rh._resolve_target(ImpersonateTarget('xyz')) is None
+
     @pytest.mark.parametrize('proxy_key,proxy_url,expected', [
         ('http', '__noproxy__', None),
         ('no', '127.0.0.1,foo.bar', '127.0.0.1,foo.bar'),
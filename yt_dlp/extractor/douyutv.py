@@ -1,6 +1,8 @@
+import functools
 import hashlib
+import re
 import time
-import urllib
+import urllib.parse
 import uuid
 
 from .common import InfoExtractor
@@ -22,6 +24,10 @@
 
 
 class DouyuBaseIE(InfoExtractor):
+    # The greedy look-behind ensures last possible script tag is matched
+    _JS_SIGN_FUNC_RE = re.compile(r'(?:<script.*)?<script[^>]*>(.*?ub98484234.*?)</script>')
+    _CRYPTOJS_MD5 = None
+
     def _download_cryptojs_md5(self, video_id):
         for url in [
             # XXX: Do NOT use cdn.bootcdn.net; ref: https://sansec.io/research/polyfill-supply-chain-attack
@@ -36,22 +42,25 @@ def _download_cryptojs_md5(self, video_id):
         raise ExtractorError('Unable to download JS dependency (crypto-js/md5)')
 
     def _get_cryptojs_md5(self, video_id):
-        return self.cache.load(
-            'douyu', 'crypto-js-md5', min_ver='2024.07.04') or self._download_cryptojs_md5(video_id)
+        if not DouyuBaseIE._CRYPTOJS_MD5:
+            DouyuBaseIE._CRYPTOJS_MD5 = self.cache.load(
+                'douyu', 'crypto-js-md5', min_ver='2024.07.04') or self._download_cryptojs_md5(video_id)
+        return DouyuBaseIE._CRYPTOJS_MD5
+
+    @functools.cached_property
+    def _phantom(self):
+        return PhantomJSwrapper(self)
 
     def _calc_sign(self, sign_func, video_id, a):
         b = uuid.uuid4().hex
         c = round(time.time())
         js_script = f'{self._get_cryptojs_md5(video_id)};{sign_func};console.log(ub98484234("{a}","{b}","{c}"))'
-        phantom = PhantomJSwrapper(self)
-        result = phantom.execute(js_script, video_id,
-                                 note='Executing JS signing script').strip()
+        result = self._phantom.execute(js_script, video_id,
+                                       note='Executing JS signing script').strip()
         return {i: v[0] for i, v in urllib.parse.parse_qs(result).items()}
 
     def _search_js_sign_func(self, webpage, fatal=True):
-        # The greedy look-behind ensures last possible script tag is matched
-        return self._search_regex(
-            r'(?:<script.*)?<script[^>]*>(.*?ub98484234.*?)</script>', webpage, 'JS sign func', fatal=fatal)
+        return self._search_regex(self._JS_SIGN_FUNC_RE, webpage, 'JS sign func', fatal=fatal)
 
 
 class DouyuTVIE(DouyuBaseIE):
@@ -128,6 +137,10 @@ class DouyuTVIE(DouyuBaseIE):
         'only_matching': True,
     }]
 
+    _ROOM_ID_RE = re.compile(r'\$ROOM\.room_id\s*=\s*(\d+)')
+    _VIDEO_LOOP_RE = re.compile(r'"videoLoop"\s*:\s*(\d+)')
+    _SHOW_STATUS_RE = re.compile(r'\$ROOM\.show_status\s*=\s*(\d+)')
+
     def _get_sign_func(self, room_id, video_id):
         return self._download_json(
             f'https://www.douyu.com/swf_api/homeH5Enc?rids={room_id}', video_id,
@@ -135,11 +148,10 @@ def _get_sign_func(self, room_id, video_id):
 
     def _extract_stream_formats(self, stream_formats):
         formats = []
-        for stream_info in traverse_obj(stream_formats, (..., 'data')):
-            stream_url = urljoin(
-                traverse_obj(stream_info, 'rtmp_url'), traverse_obj(stream_info, 'rtmp_live'))
+        for stream_info in traverse_obj(stream_formats, (..., 'data', {dict})):
+            stream_url = urljoin(stream_info.get('rtmp_url'), stream_info.get('rtmp_live'))
             if stream_url:
-                rate_id = traverse_obj(stream_info, ('rate', {int_or_none}))
+                rate_id = int_or_none(stream_info.get('rate'))
                 rate_info = traverse_obj(stream_info, ('multirates', lambda _, v: v['rate'] == rate_id), get_all=False)
                 ext = determine_ext(stream_url)
                 formats.append({
@@ -159,13 +171,13 @@ def _real_extract(self, url):
         video_id = self._match_id(url)
 
         webpage = self._download_webpage(url, video_id)
-        room_id = self._search_regex(r'\$ROOM\.room_id\s*=\s*(\d+)', webpage, 'room id')
-
-        if self._search_regex(r'"videoLoop"\s*:\s*(\d+)', webpage, 'loop', default='') == '1':
+        if self._search_regex(self._VIDEO_LOOP_RE, webpage, 'loop', default='') == '1':
             raise UserNotLive('The channel is auto-playing VODs', video_id=video_id)
-        if self._search_regex(r'\$ROOM\.show_status\s*=\s*(\d+)', webpage, 'status', default='') == '2':
+        if self._search_regex(self._SHOW_STATUS_RE, webpage, 'status', default='') == '2':
             raise UserNotLive(video_id=video_id)
 
+        room_id = self._search_regex(self._ROOM_ID_RE, webpage, 'room id')
+
         # Grab metadata from API
         params = {
             'aid': 'wp',
@@ -183,22 +195,18 @@ def _real_extract(self, url):
             raise UserNotLive(video_id=video_id)
 
         js_sign_func = self._search_js_sign_func(webpage, fatal=False) or self._get_sign_func(room_id, video_id)
-        form_data = {
-            'rate': 0,
-            **self._calc_sign(js_sign_func, video_id, room_id),
-        }
+        sign = self._calc_sign(js_sign_func, video_id, room_id)
+        stream_api_url = f'https://www.douyu.com/lapi/live/getH5Play/{room_id}'
         stream_formats = [self._download_json(
-            f'https://www.douyu.com/lapi/live/getH5Play/{room_id}',
-            video_id, note='Downloading livestream format',
-            data=urlencode_postdata(form_data))]
+            stream_api_url, video_id, note='Downloading livestream format',
+            data=urlencode_postdata({'rate': 0, **sign}))]
 
+        default_rate_id = traverse_obj(stream_formats[0], ('data', 'rate'))
         for rate_id in traverse_obj(stream_formats[0], ('data', 'multirates', ..., 'rate')):
-            if rate_id != traverse_obj(stream_formats[0], ('data', 'rate')):
-                form_data['rate'] = rate_id
+            if rate_id != default_rate_id:
                 stream_formats.append(self._download_json(
-                    f'https://www.douyu.com/lapi/live/getH5Play/{room_id}',
-                    video_id, note=f'Downloading livestream format {rate_id}',
-                    data=urlencode_postdata(form_data)))
+                    stream_api_url, video_id, note=f'Downloading livestream format {rate_id}',
+                    data=urlencode_postdata({'rate': rate_id, **sign})))
 
         return {
             'id': room_id,
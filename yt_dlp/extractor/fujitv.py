@@ -6,11 +6,11 @@ class FujiTVFODPlus7IE(InfoExtractor):
     _VALID_URL = r'https?://fod\.fujitv\.co\.jp/title/(?P<sid>[0-9a-z]{4})/(?P<id>[0-9a-z]+)'
     _BASE_URL = 'https://i.fod.fujitv.co.jp/'
     _BITRATE_MAP = {
-        300: (320, 180),
-        800: (640, 360),
-        1200: (1280, 720),
-        2000: (1280, 720),
-        4000: (1920, 1080),
+        300: {'width': 320, 'height': 180},
+        800: {'width': 640, 'height': 360},
+        1200: {'width': 1280, 'height': 720},
+        2000: {'width': 1280, 'height': 720},
+        4000: {'width': 1920, 'height': 1080},
     }
 
     _TESTS = [{
@@ -55,8 +55,7 @@ def _real_extract(self, url):
                 continue
             fmt, subs = self._extract_m3u8_formats_and_subtitles(src['url'], video_id, 'ts')
             for f in fmt:
-                f.update(dict(zip(('height', 'width'),
-                                  self._BITRATE_MAP.get(f.get('tbr'), ()))))
+                f.update(self._BITRATE_MAP.get(f.get('tbr'), {}))
             formats.extend(fmt)
             subtitles = self._merge_subtitles(subtitles, subs)
 
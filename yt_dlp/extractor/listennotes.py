@@ -50,8 +50,11 @@ class ListenNotesIE(InfoExtractor):
         },
     }]
 
+    _PARAGRAPH_TAGS_RE = re.compile(r'(</?(div|p)>\s*)+')
+    _DURATION_DESCRIPTION_RE = re.compile(r'(?P<duration>[\d:]+)\s*-\s*(?P<description>.+)')
+
     def _clean_description(self, description):
-        return clean_html(re.sub(r'(</?(div|p)>\s*)+', '<br/><br/>', description or ''))
+        return clean_html(self._PARAGRAPH_TAGS_RE.sub('<br/><br/>', description or ''))
 
     def _real_extract(self, url):
         audio_id = self._match_id(url)
@@ -62,7 +65,7 @@ def _real_extract(self, url):
             r'episode-play-button-toolbar|episode-no-play-button-toolbar', webpage, escape_value=False)))
 
         duration, description = self._search_regex(
-            r'(?P<duration>[\d:]+)\s*-\s*(?P<description>.+)',
+            self._DURATION_DESCRIPTION_RE,
             self._html_search_meta(['og:description', 'description', 'twitter:description'], webpage),
             'description', fatal=False, group=('duration', 'description')) or (None, None)
 
@@ -204,9 +204,11 @@ def _real_extract(self, url):
             'display_id': display_id,
             'title': videos.get('title'),
             'season': videos.get('season_name'),
-            'thumbnail': traverse_obj(videos, ('program_detail', 'thumbnail_image')),
-            'description': traverse_obj(videos, ('program_detail', 'description')),
             'episode_number': videos.get('episode_order'),
+            **traverse_obj(videos, ('program_detail', {
+                'thumbnail': 'thumbnail_image',
+                'description': 'description',
+            })),
             '__post_extractor': self.extract_comments(display_id),
         }
 
@@ -235,11 +237,13 @@ def parse_playlist(self, json_data, playlist_id):
         slug_sample = traverse_obj(json_data, ('related', 'data', ..., 'slug'))[0]
         for season in traverse_obj(json_data, ('seasons', ..., 'id')):
             playlist_json = self._call_api(
-                slug_sample, 'season', display_id=playlist_id, season_id=season)
+                slug_sample, 'season', query={'page': 1}, season_id=season, display_id=playlist_id)
+            last_page = playlist_json['response']['season_list']['last_page']
 
-            for current_page in range(playlist_json['response']['season_list']['last_page']):
-                playlist_json = self._call_api(slug_sample, 'season', query={'page': current_page + 1},
-                                               season_id=season, display_id=playlist_id)
+            for current_page in range(1, last_page + 1):
+                if current_page > 1:
+                    playlist_json = self._call_api(slug_sample, 'season', query={'page': current_page},
+                                                   season_id=season, display_id=playlist_id)
                 for slug in traverse_obj(playlist_json, ('response', ..., 'data', ..., 'slug')):
                     yield self.url_result(f'https://www.netverse.id/video/{slug}', NetverseIE)
 
@@ -57,6 +57,8 @@ class PornboxIE(InfoExtractor):
             'No video formats found', 'Requested format is not available'],
     }]
 
+    _quality = staticmethod(qualities(('web', 'vga', 'hd', '1080p', '4k', '8k')))
+
     def _real_extract(self, url):
         video_id = self._match_id(url)
 
@@ -101,12 +103,11 @@ def _real_extract(self, url):
         stream_data = self._download_json(
             f'https://pornbox.com/media/{media_id}/stream', video_id=video_id, note='Getting manifest urls')
 
-        get_quality = qualities(['web', 'vga', 'hd', '1080p', '4k', '8k'])
         metadata['formats'] = traverse_obj(stream_data, ('qualities', lambda _, v: v['src'], {
             'url': 'src',
             'vbr': ('bitrate', {functools.partial(int_or_none, scale=1000)}),
             'format_id': ('quality', {str_or_none}),
-            'quality': ('quality', {get_quality}),
+            'quality': ('quality', {self._quality}),
             'width': ('size', {lambda x: int(x[:-1])}),
         }))
 
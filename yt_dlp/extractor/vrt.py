@@ -1,5 +1,6 @@
 import functools
 import json
+import re
 import time
 import urllib.parse
 
@@ -14,6 +15,7 @@
     get_element_html_by_class,
     int_or_none,
     join_nonempty,
+    jwt_decode_hs256,
     jwt_encode_hs256,
     make_archive_id,
     merge_dicts,
@@ -50,13 +52,19 @@ class VRTBaseIE(GigyaBaseIE):
     _JWT_SIGNING_KEY = 'b5f500d55cb44715107249ccd8a5c0136cfb2788dbb71b90a4f142423bacaf38'  # -dev
     # player-stag.vrt.be key:    d23987504521ae6fbf2716caca6700a24bb1579477b43c84e146b279de5ca595
     # player.vrt.be key:         2a9251d782700769fb856da5725daf38661874ca6f80ae7dc2b05ec1a81a24ae
+    _PLAYER_TOKEN = None
+    _PLAYER_TOKEN_EXPIRY = 0
 
     def _extract_formats_and_subtitles(self, data, video_id):
+        targets = traverse_obj(data, ('targetUrls', lambda _, v: url_or_none(v['url']) and v['type']))
         if traverse_obj(data, 'drm'):
             self.report_drm(video_id)
+            # Only reached with --ignore-no-formats-error; don't fetch manifests that can't be downloaded
+            if not self.get_param('allow_unplayable_formats'):
+                targets = []
 
         formats, subtitles = [], {}
-        for target in traverse_obj(data, ('targetUrls', lambda _, v: url_or_none(v['url']) and v['type'])):
+        for target in targets:
             format_type = target['type'].upper()
             format_url = target['url']
             if format_type in ('HLS', 'HLS_AES'):
@@ -88,7 +96,11 @@ def _extract_formats_and_subtitles(self, data, video_id):
 
         return formats, subtitles
 
-    def _call_api(self, video_id, client='null', id_token=None, version='v2'):
+    def _get_player_token(self, video_id, id_token=None):
+        # Anonymous tokens are not tied to a video, so reuse them until shortly before they expire
+        if not id_token and VRTBaseIE._PLAYER_TOKEN and VRTBaseIE._PLAYER_TOKEN_EXPIRY > time.time():
+            return VRTBaseIE._PLAYER_TOKEN
+
         player_info = {'exp': (round(time.time(), 3) + 900), **self._PLAYER_INFO}
         player_token = self._download_json(
             'https://media-services-public.vrt.be/vualto-video-aggregator-web/rest/external/v2/tokens',
@@ -102,6 +114,15 @@ def _call_api(self, video_id, client='null', id_token=None, version='v2'):
                 }).decode(),
             }, separators=(',', ':')).encode())['vrtPlayerToken']
 
+        if not id_token:
+            VRTBaseIE._PLAYER_TOKEN = player_token
+            VRTBaseIE._PLAYER_TOKEN_EXPIRY = traverse_obj(player_token, (
+                {jwt_decode_hs256}, 'exp', {float_or_none}), default=player_info['exp']) - 60
+        return player_token
+
+    def _call_api(self, video_id, client='null', id_token=None, version='v2'):
+        player_token = self._get_player_token(video_id, id_token)
+
         return self._download_json(
             f'https://media-services-public.vrt.be/media-aggregator/{version}/media-items/{video_id}',
             video_id, 'Downloading API JSON', query={
@@ -147,15 +168,15 @@ def _real_extract(self, url):
         attrs = extract_attributes(get_element_html_by_class('vrtvideo', webpage) or '')
 
         asset_id = attrs.get('data-video-id') or attrs['data-videoid']
-        publication_id = traverse_obj(attrs, 'data-publication-id', 'data-publicationid')
+        publication_id = attrs.get('data-publication-id') or attrs.get('data-publicationid')
         if publication_id:
             asset_id = f'{publication_id}${asset_id}'
-        client = traverse_obj(attrs, 'data-client-code', 'data-client') or self._CLIENT_MAP[site]
+        client = attrs.get('data-client-code') or attrs.get('data-client') or self._CLIENT_MAP[site]
 
         data = self._call_api(asset_id, client)
         formats, subtitles = self._extract_formats_and_subtitles(data, asset_id)
 
-        description = self._html_search_meta(
+        description = traverse_obj(data, ('shortDescription', {str})) or self._html_search_meta(
             ['og:description', 'twitter:description', 'description'], webpage)
         if description == '…':
             description = None
@@ -170,7 +191,6 @@ def _real_extract(self, url):
             '_old_archive_ids': [make_archive_id('Canvas', asset_id)],
             **traverse_obj(data, {
                 'title': ('title', {str}),
-                'description': ('shortDescription', {str}),
                 'duration': ('duration', {functools.partial(float_or_none, scale=1000)}),
                 'thumbnail': ('posterImageUrl', {url_or_none}),
             }),
@@ -304,24 +324,27 @@ def _real_extract(self, url):
             raise ExtractorError(code, expected=True)
 
         formats, subtitles = self._extract_formats_and_subtitles(video_info, video_id)
+        timestamp = traverse_obj(details, ('data', 'episode', 'onTime', 'raw', {parse_iso8601}))
 
         return {
             **traverse_obj(details, {
                 'title': 'title',
                 'description': ('description', {clean_html}),
-                'timestamp': ('data', 'episode', 'onTime', 'raw', {parse_iso8601}),
-                'release_timestamp': ('data', 'episode', 'onTime', 'raw', {parse_iso8601}),
-                'series': ('data', 'program', 'title'),
-                'season': ('data', 'season', 'title', 'value'),
-                'season_number': ('data', 'season', 'title', 'raw', {int_or_none}),
-                'season_id': ('data', 'season', 'id', {str_or_none}),
-                'episode': ('data', 'episode', 'number', 'value', {str_or_none}),
-                'episode_number': ('data', 'episode', 'number', 'raw', {int_or_none}),
-                'episode_id': ('data', 'episode', 'id', {str_or_none}),
-                'age_limit': ('data', 'episode', 'age', 'raw', {parse_age_limit}),
             }),
+            **traverse_obj(details, ('data', {
+                'series': ('program', 'title'),
+                'season': ('season', 'title', 'value'),
+                'season_number': ('season', 'title', 'raw', {int_or_none}),
+                'season_id': ('season', 'id', {str_or_none}),
+                'episode': ('episode', 'number', 'value', {str_or_none}),
+                'episode_number': ('episode', 'number', 'raw', {int_or_none}),
+                'episode_id': ('episode', 'id', {str_or_none}),
+                'age_limit': ('episode', 'age', 'raw', {parse_age_limit}),
+            })),
             'id': video_id,
             'display_id': display_id,
+            'timestamp': timestamp,
+            'release_timestamp': timestamp,
             'channel': 'VRT',
             'formats': formats,
             'duration': float_or_none(video_info.get('duration'), 1000),
@@ -405,11 +428,12 @@ class DagelijkseKostIE(VRTBaseIE):
         'params': {'skip_download': 'm3u8'},
     }]
 
+    _DATA_URL_RE = re.compile(r'''data-url=(?:"([^"]+)"|'([^']+)')''')
+
     def _real_extract(self, url):
         display_id = self._match_id(url)
         webpage = self._download_webpage(url, display_id)
-        video_id = self._html_search_regex(
-            r'data-url=(["\'])(?P<id>(?:(?!\1).)+)\1', webpage, 'video id', group='id')
+        video_id = self._html_search_regex(self._DATA_URL_RE, webpage, 'video id')
 
         data = self._call_api(video_id, 'dako@prod', version='v1')
         formats, subtitles = self._extract_formats_and_subtitles(data, video_id)
@@ -9,7 +9,7 @@
 import warnings
 
 from ..dependencies import brotli, requests, urllib3
-from ..utils import bug_reports_message, int_or_none, variadic
+from ..utils import bug_reports_message, int_or_none
 from ..utils.networking import normalize_url
 
 if requests is None:
@@ -34,7 +34,6 @@
 
 from ._helper import (
     InstanceStoreMixin,
-    add_accept_encoding_header,
     create_connection,
     create_socks_proxy_socket,
     get_redirect_method,
@@ -59,12 +58,17 @@
 )
 from ..socks import ProxyError as SocksProxyError
 
-SUPPORTED_ENCODINGS = [
+SUPPORTED_ENCODINGS = (
     'gzip', 'deflate',
-]
+)
 
 if brotli is not None:
-    SUPPORTED_ENCODINGS.append('br')
+    SUPPORTED_ENCODINGS += ('br',)
+
+_ACCEPT_ENCODING = ', '.join(SUPPORTED_ENCODINGS)
+
+# Retry objects are immutable (increment() returns a new one), so one can be shared by all adapters
+_NO_RETRY = urllib3.util.retry.Retry(False)
 
 '''
 Override urllib3's behavior to not convert lower-case percent-encoded characters
@@ -87,13 +91,16 @@
 class Urllib3PercentREOverride:
     def __init__(self, r: re.Pattern):
         self.re = r
+        # urllib3 also calls sub() while parsing URLs; bind it directly to skip __getattr__
+        self.sub = r.sub
+        self._subn = r.subn
 
     # pass through all other attribute calls to the original re
     def __getattr__(self, item):
         return self.re.__getattribute__(item)
 
     def subn(self, repl, string, *args, **kwargs):
-        return string, self.re.subn(repl, string, *args, **kwargs)[1]
+        return string, self._subn(repl, string, *args, **kwargs)[1]
 
 
 # urllib3 >= 1.25.8 uses subn:
@@ -149,14 +156,12 @@ def read(self, amt: int | None = None):
         except urllib3.exceptions.ProtocolError as e:
             # IncompleteRead is always contained within ProtocolError
             # See urllib3.response.HTTPResponse._error_catcher()
-            ir_err = next(
-                (err for err in (e.__context__, e.__cause__, *variadic(e.args))
-                 if isinstance(err, http.client.IncompleteRead)), None)
-            if ir_err is not None:
-                # `urllib3.exceptions.IncompleteRead` is subclass of `http.client.IncompleteRead`
-                # but uses an `int` for its `partial` property.
-                partial = ir_err.partial if isinstance(ir_err.partial, int) else len(ir_err.partial)
-                raise IncompleteRead(partial=partial, expected=ir_err.expected) from e
+            for ir_err in (e.__context__, e.__cause__, *e.args):
+                if isinstance(ir_err, http.client.IncompleteRead):
+                    # `urllib3.exceptions.IncompleteRead` is subclass of `http.client.IncompleteRead`
+                    # but uses an `int` for its `partial` property.
+                    partial = ir_err.partial if isinstance(ir_err.partial, int) else len(ir_err.partial)
+                    raise IncompleteRead(partial=partial, expected=ir_err.expected) from e
             raise TransportError(cause=e) from e
 
         except urllib3.exceptions.HTTPError as e:
@@ -178,6 +183,8 @@ def init_poolmanager(self, *args, **kwargs):
         return super().init_poolmanager(*args, **kwargs, **self._pm_args)
 
     def proxy_manager_for(self, proxy, **proxy_kwargs):
+        if proxy in self.proxy_manager:
+            return self.proxy_manager[proxy]
         extra_kwargs = {}
         if not proxy.lower().startswith('socks') and self._proxy_ssl_context:
             extra_kwargs['proxy_ssl_context'] = self._proxy_ssl_context
@@ -235,10 +242,12 @@ def filter(self, record):
 
 class Urllib3LoggingHandler(logging.Handler):
     """Redirect urllib3 logs to our logger"""
+    _FORMATTER = logging.Formatter('requests: %(message)s')
 
     def __init__(self, logger, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._logger = logger
+        self.setFormatter(self._FORMATTER)
 
     def emit(self, record):
         try:
@@ -259,18 +268,18 @@ class RequestsRH(RequestHandler, InstanceStoreMixin):
     https://github.com/psf/requests
     """
     _SUPPORTED_URL_SCHEMES = ('http', 'https')
-    _SUPPORTED_ENCODINGS = tuple(SUPPORTED_ENCODINGS)
+    _SUPPORTED_ENCODINGS = SUPPORTED_ENCODINGS
     _SUPPORTED_PROXY_SCHEMES = ('http', 'https', 'socks4', 'socks4a', 'socks5', 'socks5h')
     _SUPPORTED_FEATURES = (Features.NO_PROXY, Features.ALL_PROXY)
     RH_NAME = 'requests'
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._http_adapters = {}
 
         # Forward urllib3 debug messages to our logger
         logger = logging.getLogger('urllib3')
         self.__logging_handler = Urllib3LoggingHandler(logger=self._logger)
-        self.__logging_handler.setFormatter(logging.Formatter('requests: %(message)s'))
         self.__logging_handler.addFilter(Urllib3LoggingFilter())
         logger.addHandler(self.__logging_handler)
         # TODO: Use a logger filter to suppress pool reuse warning instead
@@ -287,6 +296,7 @@ def __init__(self, *args, **kwargs):
 
     def close(self):
         self._clear_instances()
+        self._http_adapters.clear()
         # Remove the logging handler that contains a reference to our logger
         # See: https://github.com/yt-dlp/yt-dlp/issues/8922
         logging.getLogger('urllib3').removeHandler(self.__logging_handler)
@@ -297,13 +307,21 @@ def _check_extensions(self, extensions):
         extensions.pop('timeout', None)
         extensions.pop('legacy_ssl', None)
 
+    def _get_http_adapter(self, legacy_ssl_support=None):
+        # Cookies are handled by the session, so sessions for different cookiejars
+        # can share an adapter (and its connection pools)
+        http_adapter = self._http_adapters.get(legacy_ssl_support)
+        if http_adapter is None:
+            http_adapter = self._http_adapters[legacy_ssl_support] = RequestsHTTPAdapter(
+                ssl_context=self._make_sslcontext(legacy_ssl_support=legacy_ssl_support),
+                source_address=self.source_address,
+                max_retries=_NO_RETRY,
+            )
+        return http_adapter
+
     def _create_instance(self, cookiejar, legacy_ssl_support=None):
         session = RequestsSession()
-        http_adapter = RequestsHTTPAdapter(
-            ssl_context=self._make_sslcontext(legacy_ssl_support=legacy_ssl_support),
-            source_address=self.source_address,
-            max_retries=urllib3.util.retry.Retry(False),
-        )
+        http_adapter = self._get_http_adapter(legacy_ssl_support)
         session.adapters.clear()
         session.headers = requests.models.CaseInsensitiveDict({'Connection': 'keep-alive'})
         session.mount('https://', http_adapter)
@@ -315,7 +333,7 @@ def _create_instance(self, cookiejar, legacy_ssl_support=None):
     def _send(self, request):
 
         headers = self._merge_headers(request.headers)
-        add_accept_encoding_header(headers, SUPPORTED_ENCODINGS)
+        headers.setdefault('Accept-Encoding', _ACCEPT_ENCODING)
 
         max_redirects_exceeded = False
 
@@ -83,6 +83,7 @@ class ImpersonateRequestHandler(RequestHandler, ABC):
     def __init__(self, *, impersonate: ImpersonateTarget = None, **kwargs):
         super().__init__(**kwargs)
         self.impersonate = impersonate
+        self._resolved_targets = {}
 
     def _check_impersonate_target(self, target: ImpersonateTarget):
         assert isinstance(target, (ImpersonateTarget, NoneType))
@@ -104,12 +105,18 @@ def _resolve_target(self, target: ImpersonateTarget | None):
         """Resolve a target to a supported target."""
         if target is None:
             return
+        if target in self._resolved_targets:
+            return self._resolved_targets[target]
+        resolved_target = None
         for supported_target in self.supported_targets:
             if target in supported_target:
                 if self.verbose:
                     self._logger.stdout(
                         f'{self.RH_NAME}: resolved impersonate target {target} to {supported_target}')
-                return supported_target
+                resolved_target = supported_target
+                break
+        self._resolved_targets[target] = resolved_target
+        return resolved_target
 
     @classproperty
     def supported_targets(cls) -> tuple[ImpersonateTarget, ...]: